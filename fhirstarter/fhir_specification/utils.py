@@ -3,7 +3,6 @@
 import importlib.metadata
 import os
 import zipfile
-from copy import deepcopy
 from typing import Dict, Set
 
 import orjson
@@ -70,7 +69,7 @@ def is_resource_type(resource_type: str) -> bool:
 @cache
 def _load_resources_list() -> Set[str]:
     """Load the list of resources from the JSON file."""
-    with open(FHIR_DIR / "resource_types.json") as file_:
+    with open(FHIR_DIR / "resource_types.json", "rb") as file_:
         return orjson.loads(file_.read())
 
 
@@ -91,9 +90,13 @@ def create_bundle_example(resource_example: Mapping[str, Any]) -> Dict[str, Any]
     """
     resource_type = resource_example["resourceType"]
     bundle_examples = load_examples("Bundle")
-    bundle_example = deepcopy(
+
+    # Only the top level and the link list are modified, so copy just those levels instead of
+    # deep copying the whole example
+    bundle_example = dict(
         cast(Dict[str, Any], next(iter(bundle_examples.values()))["value"])
     )
+    bundle_example["link"] = list(bundle_example["link"])
 
     bundle_example["link"][0] = {
         "relation": "self",
@@ -140,5 +143,5 @@ def load_search_parameters() -> Dict[str, Any]:
 
 def load_extra_search_parameters() -> Dict[str, Dict[str, Union[str, bool]]]:
     """Load the extra search parameters file."""
-    with open(FHIR_DIR / "extra-search-parameters.json") as file_:
+    with open(FHIR_DIR / "extra-search-parameters.json", "rb") as file_:
         return orjson.loads(file_.read())
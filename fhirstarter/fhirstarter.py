@@ -199,11 +199,11 @@ class FHIRStarter(FastAPI):
         )
 
         for interaction in sorted(
-            sorted(
-                provider_interactions,
-                key=lambda i: cast(str, i.resource_type.get_resource_type()),
+            provider_interactions,
+            key=lambda i: (
+                _INTERACTION_ORDER[i.label()],
+                cast(str, i.resource_type.get_resource_type()),
             ),
-            key=lambda i: _INTERACTION_ORDER[i.label()],
         ):
             resource_type = interaction.resource_type.get_resource_type()
             label = interaction.label()
@@ -484,25 +484,26 @@ class FHIRStarter(FastAPI):
         FHIR search-type routes must support both GET and POST, so two routes are added for
         search-type interactions.
         """
-        if interaction.label() == "read":
+        label = interaction.label()
+        if label == "read":
             self.get(**read_route_args(interaction))(make_read_function(interaction))
-        elif interaction.label() == "update":
+        elif label == "update":
             self.put(**update_route_args(interaction))(
                 make_update_function(interaction)
             )
-        elif interaction.label() == "patch":
+        elif label == "patch":
             self.patch(**patch_route_args(interaction))(
                 make_patch_function(interaction)
             )
-        elif interaction.label() == "delete":
+        elif label == "delete":
             self.delete(**delete_route_args(interaction))(
                 make_delete_function(interaction)
             )
-        elif interaction.label() == "create":
+        elif label == "create":
             self.post(**create_route_args(interaction))(
                 make_create_function(interaction)
             )
-        elif interaction.label() == "search-type":
+        elif label == "search-type":
             search_parameter_metadata = self._search_parameters.get_metadata(
                 interaction.resource_type.get_resource_type()
             )
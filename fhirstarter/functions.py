@@ -20,7 +20,7 @@ places.
 
 import keyword
 from inspect import Parameter, iscoroutinefunction, signature
-from typing import Callable, Coroutine, Dict, List, Tuple, Union, cast
+from typing import Callable, Coroutine, Dict, List, Mapping, Tuple, Union, cast
 
 from fastapi import Form, Path, Query, Request, Response
 
@@ -68,8 +68,9 @@ def make_read_function(
     Union[Coroutine[None, None, Union[ResourceType, Response]], ResourceType, Response],
 ]:
     """Make a function suitable for creation of a FHIR read API route."""
+    handler = cast(ReadInteractionHandler[ResourceType], interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def read_async(
             request: Request,
@@ -82,7 +83,6 @@ def make_read_function(
             _pretty: str = PRETTY_QP,
         ) -> Union[ResourceType, Response]:
             """Function for read interaction."""
-            handler = cast(ReadInteractionHandler[ResourceType], interaction.handler)
             result_resource = await handler(InteractionContext(request, response), id_)  # type: ignore[call-arg]
 
             return format_response(
@@ -106,7 +106,6 @@ def make_read_function(
             _pretty: str = PRETTY_QP,
         ) -> Union[ResourceType, Response]:
             """Function for read interaction."""
-            handler = cast(ReadInteractionHandler[ResourceType], interaction.handler)
             result_resource = handler(InteractionContext(request, response), id_)  # type: ignore[call-arg]
 
             return format_response(
@@ -126,8 +125,9 @@ def make_update_function(
 ]:
     """Make a function suitable for creation of a FHIR update API route."""
     resource_type_str = interaction.resource_type.get_resource_type()
+    handler = cast(UpdateInteractionHandler[ResourceType], interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def update_async(
             request: Request,
@@ -147,7 +147,6 @@ def make_update_function(
                     details_text="Logical Id in URL must match logical Id in resource",
                 )
 
-            handler = cast(UpdateInteractionHandler[ResourceType], interaction.handler)
             result = await handler(InteractionContext(request, response), id_, resource)  # type: ignore[call-arg]
             _, result_resource = _result_to_id_resource_tuple(result)
 
@@ -186,7 +185,6 @@ def make_update_function(
                     details_text="Logical Id in URL must match logical Id in resource",
                 )
 
-            handler = cast(UpdateInteractionHandler[ResourceType], interaction.handler)
             result = handler(InteractionContext(request, response), id_, resource)  # type: ignore[call-arg]
             _, result_resource = _result_to_id_resource_tuple(result)
 
@@ -219,8 +217,9 @@ def make_patch_function(
 ]:
     """Make a function suitable for creation of a FHIR patch API route."""
     resource_type_str = interaction.resource_type.get_resource_type()
+    handler = cast(PatchInteractionHandler[ResourceType], interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def patch_async(
             request: Request,
@@ -234,7 +233,6 @@ def make_patch_function(
             _pretty: str = PRETTY_QP,
         ) -> Union[ResourceType, Response]:
             """Function for patch interaction."""
-            handler = cast(PatchInteractionHandler[ResourceType], interaction.handler)
             result = await handler(InteractionContext(request, response), id_, json_patch)  # type: ignore[call-arg]
             _, result_resource = _result_to_id_resource_tuple(result)
 
@@ -261,7 +259,6 @@ def make_patch_function(
             _pretty: str = PRETTY_QP,
         ) -> Union[ResourceType, Response]:
             """Function for patch interaction."""
-            handler = cast(PatchInteractionHandler[ResourceType], interaction.handler)
             result = handler(InteractionContext(request, response), id_, json_patch)  # type: ignore[call-arg]
             _, result_resource = _result_to_id_resource_tuple(result)
 
@@ -284,8 +281,9 @@ def make_delete_function(
 ]:
     """Make a function suitable for creation of a FHIR delete API route."""
     resource_type_str = interaction.resource_type.get_resource_type()
+    handler = cast(DeleteInteractionHandler, interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def delete_async(
             request: Request,
@@ -298,7 +296,6 @@ def make_delete_function(
             _pretty: str = PRETTY_QP,
         ) -> None:
             """Function for delete interaction."""
-            handler = cast(DeleteInteractionHandler, interaction.handler)
             await handler(InteractionContext(request, response), id_)  # type: ignore[call-arg,misc]
 
             return None
@@ -317,7 +314,6 @@ def make_delete_function(
             _pretty: str = PRETTY_QP,
         ) -> None:
             """Function for delete interaction."""
-            handler = cast(DeleteInteractionHandler, interaction.handler)
             handler(InteractionContext(request, response), id_)  # type: ignore[call-arg]
 
             return None
@@ -337,8 +333,9 @@ def make_create_function(
 ]:
     """Make a function suitable for creation of a FHIR create API route."""
     resource_type_str = interaction.resource_type.get_resource_type()
+    handler = cast(CreateInteractionHandler[ResourceType], interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def create_async(
             request: Request,
@@ -352,7 +349,6 @@ def make_create_function(
 
             Calls the handler, and sets the Location header based on the Id of the created resource.
             """
-            handler = cast(CreateInteractionHandler[ResourceType], interaction.handler)
             result = await handler(InteractionContext(request, response), resource)  # type: ignore[call-arg]
             id_, result_resource = _result_to_id_resource_tuple(result)
 
@@ -385,7 +381,6 @@ def make_create_function(
 
             Calls the handler, and sets the Location header based on the Id of the created resource.
             """
-            handler = cast(CreateInteractionHandler[ResourceType], interaction.handler)
             result = handler(InteractionContext(request, response), resource)  # type: ignore[call-arg]
             id_, result_resource = _result_to_id_resource_tuple(result)
 
@@ -409,7 +404,7 @@ def make_create_function(
 # TODO: If possible, map FHIR primitives to correct type annotations for better validation
 def make_search_type_function(
     interaction: TypeInteraction[ResourceType],
-    search_parameter_metadata: Dict[str, Dict[str, str]],
+    search_parameter_metadata: Mapping[str, Mapping[str, str]],
     post: bool,
 ) -> Callable[
     [Request, Response, str, str],
@@ -445,8 +440,9 @@ def make_search_type_function(
         )
         for search_parameter in supported_search_parameters(interaction.handler)
     )
+    handler = cast(SearchTypeInteractionHandler, interaction.handler)
 
-    if iscoroutinefunction(interaction.handler):
+    if iscoroutinefunction(handler):
 
         async def search_type_async(
             request: Request,
@@ -457,7 +453,6 @@ def make_search_type_function(
             **kwargs: str,
         ) -> Union[Bundle, Response]:
             """Function for search-type interaction."""
-            handler = cast(SearchTypeInteractionHandler, interaction.handler)
             bundle = await handler(InteractionContext(request, response), **kwargs)  # type: ignore[call-arg]
 
             return format_response(
@@ -481,7 +476,6 @@ def make_search_type_function(
             **kwargs: str,
         ) -> Union[Bundle, Response]:
             """Function for search-type interaction."""
-            handler = cast(SearchTypeInteractionHandler, interaction.handler)
             bundle = handler(InteractionContext(request, response), **kwargs)  # type: ignore[call-arg]
 
             return format_response(
@@ -554,7 +548,7 @@ def _set_search_type_function_signature(
         ..., Union[Coroutine[None, None, Union[Bundle, Response]], Bundle, Response]
     ],
     search_parameters: Tuple[Parameter, ...],
-    search_parameter_metadata: Dict[str, Dict[str, str]],
+    search_parameter_metadata: Mapping[str, Mapping[str, str]],
 ) -> Callable[
     [Request, Response, str, str],
     Union[Coroutine[None, None, Union[Bundle, Response]], Bundle, Response],
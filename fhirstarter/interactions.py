@@ -72,6 +72,8 @@ class TypeInteraction(Generic[ResourceType]):
     route_options:    Dictionary of key-value pairs that are passed on to FastAPI on route creation.
     """
 
+    __slots__ = ("resource_type", "handler", "route_options")
+
     def __init__(
         self,
         resource_type: Type[ResourceType],
@@ -89,36 +91,48 @@ class TypeInteraction(Generic[ResourceType]):
 
 
 class ReadInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["read"]:
         return "read"
 
 
 class UpdateInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["update"]:
         return "update"
 
 
 class PatchInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["patch"]:
         return "patch"
 
 
 class DeleteInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["delete"]:
         return "delete"
 
 
 class CreateInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["create"]:
         return "create"
 
 
 class SearchTypeInteraction(TypeInteraction[ResourceType]):
+    __slots__ = ()
+
     @staticmethod
     def label() -> Literal["search-type"]:
         return "search-type"
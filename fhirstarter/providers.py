@@ -1,9 +1,15 @@
 """FHIRProvider class, for registering FHIR interactions with a FHIRStarter app."""
 
+from types import MappingProxyType
+
+try:
+    from functools import cache
+except ImportError:
+    from functools import lru_cache as cache
+
 from typing import (
     Any,
     Callable,
-    Iterable,
     List,
     Mapping,
     Protocol,
@@ -37,6 +43,11 @@ from .resources import Resource
 
 C = TypeVar("C", bound=Callable[..., Any])
 
+# Route options for interactions registered without dependencies, shared between interactions
+_DEFAULT_ROUTE_OPTIONS: Mapping[str, Any] = MappingProxyType(
+    {"dependencies": (), "include_in_schema": True}
+)
+
 
 class TypeInteractionType(Protocol[ResourceType]):
     @staticmethod
@@ -64,8 +75,9 @@ class FHIRProvider:
         self._interactions: List[TypeInteraction[Resource]] = []
 
     @property
-    def interactions(self) -> Iterable[TypeInteraction[Resource]]:
-        yield from self._interactions
+    def interactions(self) -> Sequence[TypeInteraction[Resource]]:
+        """Return an immutable snapshot of the registered interactions."""
+        return tuple(self._interactions)
 
     def read(
         self,
@@ -80,7 +92,7 @@ class FHIRProvider:
         """Register a FHIR read interaction."""
         return self._register_type_interaction(
             resource_type,
-            ReadInteraction[ResourceType],
+            ReadInteraction,
             dependencies,
             include_in_schema,
         )
@@ -97,7 +109,7 @@ class FHIRProvider:
         """Register a FHIR update interaction."""
         return self._register_type_interaction(
             resource_type,
-            UpdateInteraction[ResourceType],
+            UpdateInteraction,
             dependencies,
             include_in_schema,
         )
@@ -114,7 +126,7 @@ class FHIRProvider:
         """Register a FHIR patch interaction."""
         return self._register_type_interaction(
             resource_type,
-            PatchInteraction[ResourceType],
+            PatchInteraction,
             dependencies,
             include_in_schema,
         )
@@ -129,7 +141,7 @@ class FHIRProvider:
         """Register a FHIR delete interaction."""
         return self._register_type_interaction(
             resource_type,
-            DeleteInteraction[ResourceType],
+            DeleteInteraction,
             dependencies,
             include_in_schema,
         )
@@ -146,7 +158,7 @@ class FHIRProvider:
         """Register a FHIR create interaction."""
         return self._register_type_interaction(
             resource_type,
-            CreateInteraction[ResourceType],
+            CreateInteraction,
             dependencies,
             include_in_schema,
         )
@@ -161,7 +173,7 @@ class FHIRProvider:
         """Register a FHIR search-type interaction."""
         return self._register_type_interaction(
             resource_type,
-            SearchTypeInteraction[ResourceType],
+            SearchTypeInteraction,
             dependencies,
             include_in_schema,
         )
@@ -175,15 +187,22 @@ class FHIRProvider:
     ) -> Callable[[C], C]:
         _check_resource_type_module(resource_type)
 
+        if not self._dependencies and not dependencies and include_in_schema:
+            route_options = _DEFAULT_ROUTE_OPTIONS
+        else:
+            route_options = MappingProxyType(
+                {
+                    "dependencies": (*self._dependencies, *(dependencies or ())),
+                    "include_in_schema": include_in_schema,
+                }
+            )
+
         def decorator(handler: C) -> C:
             self._interactions.append(
                 type_interaction_cls(
                     resource_type=resource_type,
                     handler=handler,
-                    route_options={
-                        "dependencies": (*self._dependencies, *(dependencies or ())),
-                        "include_in_schema": include_in_schema,
-                    },
+                    route_options=route_options,
                 )
             )
             return handler
@@ -191,8 +210,14 @@ class FHIRProvider:
         return decorator
 
 
+@cache
 def _check_resource_type_module(resource_type: Type[Resource]) -> None:
-    """Ensure that the resource type is compatible with the server's defined FHIR sequence."""
+    """
+    Ensure that the resource type is compatible with the server's defined FHIR sequence.
+
+    The check is cached per resource type, since applications typically register several
+    interactions for each resource type.
+    """
 
     # Get the module name of the resource's fhir.resources parent class. If a user is using a model
     # with custom examples, then their model will inherit from something that this code will
@@ -204,19 +229,26 @@ def _check_resource_type_module(resource_type: Type[Resource]) -> None:
     for base in bases:
         if base.__module__.startswith("fhir.resources"):
             module = base.__module__
-    assert (
-        module
-    ), f"Unable to determine FHIR sequence of resource {resource_type.get_resource_type()}"
+
+    # Explicit raises are used rather than assert statements so that these checks are not skipped
+    # when Python runs with optimizations enabled
+    if not module:
+        raise AssertionError(
+            f"Unable to determine FHIR sequence of resource {resource_type.get_resource_type()}"
+        )
 
     if FHIR_SEQUENCE in ("R4", "R5"):
-        assert not module.startswith(
-            ("fhir.resources.STU3", "fhir.resources.R4B")
-        ), f"Resource types from {module} cannot be used with FHIR sequence {FHIR_SEQUENCE}"
+        if module.startswith(("fhir.resources.STU3", "fhir.resources.R4B")):
+            raise AssertionError(
+                f"Resource types from {module} cannot be used with FHIR sequence {FHIR_SEQUENCE}"
+            )
     elif FHIR_SEQUENCE == "STU3":
-        assert module.startswith(
-            "fhir.resources.STU3"
-        ), "Only resource types from fhir.resources.STU3 can be used with FHIR sequence STU3"
+        if not module.startswith("fhir.resources.STU3"):
+            raise AssertionError(
+                "Only resource types from fhir.resources.STU3 can be used with FHIR sequence STU3"
+            )
     elif FHIR_SEQUENCE == "R4B":
-        assert module.startswith(
-            "fhir.resources.R4B"
-        ), "Only resource types from fhir.resources.R4B can be used with FHIR sequence R4B"
+        if not module.startswith("fhir.resources.R4B"):
+            raise AssertionError(
+                "Only resource types from fhir.resources.R4B can be used with FHIR sequence R4B"
+            )
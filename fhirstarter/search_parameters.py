@@ -3,17 +3,33 @@ Functions for working with search parameters defined for search operations in th
 specification.
 """
 
+import contextlib
 import inspect
 import re
-from copy import deepcopy
+import sys
+from collections import defaultdict
 from dataclasses import dataclass
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 try:
     from functools import cache
 except ImportError:
     from functools import lru_cache as cache
 
-from typing import Any, Callable, Dict, Mapping, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    ForwardRef,
+    Mapping,
+    MutableMapping,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from fastapi import Request, Response
 
@@ -23,6 +39,8 @@ from .fhir_specification.utils import (
 )
 from .interactions import InteractionContext
 
+_UNDERSCORE_LOWERCASE_PATTERN = re.compile("_([a-z])")
+
 
 class SearchParameters:
     def __init__(
@@ -32,25 +50,40 @@ class SearchParameters:
         ] = None,
     ):
         self._custom_search_parameters = custom_search_parameters or {}
+        self._metadata: Dict[str, Mapping[str, Mapping[str, str]]] = {}
 
-    def get_metadata(self, resource_type: str) -> Dict[str, Dict[str, str]]:
+    def get_metadata(self, resource_type: str) -> Mapping[str, Mapping[str, str]]:
         """
         Return search parameter metadata for the given resource type.
 
         For a given resource type, the search parameter metadata is a union between the search
         parameter metadata for the resource type itself, DomainResource, Resource, and custom search
         parameter metadata.
+
+        The result is computed once per resource type and cached on the instance, since custom
+        search parameters do not change after initialization. The same read-only mapping is returned
+        on every call, and its values are shared with the process-wide search parameter cache, so
+        callers must not mutate them.
         """
+        if resource_type in self._metadata:
+            return self._metadata[resource_type]
+
         all_search_parameters = _load_search_parameters_file()
 
-        search_parameters = deepcopy(all_search_parameters.get(resource_type, {}))
-        search_parameters.update(all_search_parameters["DomainResource"])
-        search_parameters.update(all_search_parameters["Resource"])
-        search_parameters.update(self._custom_search_parameters.get(resource_type, {}))
+        search_parameters = MappingProxyType(
+            {
+                **all_search_parameters.get(resource_type, {}),
+                **all_search_parameters["DomainResource"],
+                **all_search_parameters["Resource"],
+                **self._custom_search_parameters.get(resource_type, {}),
+            }
+        )
+        self._metadata[resource_type] = search_parameters
 
         return search_parameters
 
 
+@cache
 def var_name_to_qp_name(name: str) -> str:
     """
     Convert a Python-friendly variable name to a FHIR query parameter name.
@@ -64,19 +97,28 @@ def var_name_to_qp_name(name: str) -> str:
     plus the lowercase version of the character.
     """
     if name.startswith("_"):
-        return f"_{re.sub('_[a-z]', lambda m: m.group(0)[1:].upper(), name[1:])}"
+        if "_" not in name[1:]:
+            return name
+        return "_" + _UNDERSCORE_LOWERCASE_PATTERN.sub(
+            lambda m: m.group(1).upper(), name[1:]
+        )
 
     if name.endswith("_"):
         name = name[:-1]
     return name.replace("_", "-")
 
 
-@dataclass
+@dataclass(frozen=True)
 class SupportedSearchParameter:
     name: str
     multiple: bool
 
 
+_SUPPORTED_SEARCH_PARAMETERS: MutableMapping[
+    Callable[..., Any], Tuple[SupportedSearchParameter, ...]
+] = WeakKeyDictionary()
+
+
 def supported_search_parameters(
     search_function: Callable[..., Any]
 ) -> Tuple[SupportedSearchParameter, ...]:
@@ -85,22 +127,52 @@ def supported_search_parameters(
     keyword and variadic positional arguments).
 
     This function is used to determine what search parameters are supported by the handler supplied
-    for a registered FHIR search interaction.
+    for a registered FHIR search interaction. The result is cached per handler, because it is needed
+    for route creation and for every capability statement request. The cache holds weak references
+    so that it does not keep discarded handlers alive.
     """
-    # TODO: There is probably a more sophisticated way of figuring out if list[str] is part of an
-    #  annotation, but this is sufficient for now.
-    return tuple(
+    try:
+        return _SUPPORTED_SEARCH_PARAMETERS[search_function]
+    except (KeyError, TypeError):
+        pass
+
+    search_parameters = tuple(
         SupportedSearchParameter(
-            name=name, multiple="list[str]" in str(parameter.annotation).lower()  # type: ignore[call-arg]
+            name=name, multiple=_is_list_of_str(parameter.annotation)  # type: ignore[call-arg]
         )
         for name, parameter in inspect.signature(search_function).parameters.items()
-        if parameter.annotation != InteractionContext
+        if parameter.annotation is not InteractionContext
     )
 
+    # Callables that do not support weak references (e.g. builtins) are not cached
+    with contextlib.suppress(TypeError):
+        _SUPPORTED_SEARCH_PARAMETERS[search_function] = search_parameters
+
+    return search_parameters
+
+
+def _is_list_of_str(annotation: Any) -> bool:
+    """
+    Return True or False depending on whether the annotation is, or contains, list[str].
+
+    The annotation is inspected structurally, so list[str] is found when nested inside a union
+    (e.g. Union[List[str], None]). Annotations that have not been evaluated (i.e. strings and
+    forward references) fall back to a string comparison.
+    """
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        return "list[str]" in annotation.lower()
+
+    if get_origin(annotation) is list:
+        return get_args(annotation) == (str,)
+
+    return any(_is_list_of_str(arg) for arg in get_args(annotation))
+
 
 def search_parameter_sort_key(
     name: str,
-    search_parameter_metadata: Dict[str, Dict[str, str]],
+    search_parameter_metadata: Mapping[str, Mapping[str, str]],
     parameter_annotation: Union[type, None] = None,
 ) -> Tuple[bool, bool, bool, bool, bool, str]:
     """
@@ -118,15 +190,16 @@ def search_parameter_sort_key(
     5. Alphabetical by name
 
     """
+    qp_name = var_name_to_qp_name(name)
+    metadata = search_parameter_metadata.get(qp_name)
+
     return (
-        parameter_annotation != Request,
-        parameter_annotation != Response,
+        parameter_annotation is not Request,
+        parameter_annotation is not Response,
         name.startswith("_"),
-        var_name_to_qp_name(name) not in search_parameter_metadata,
-        not search_parameter_metadata.get(var_name_to_qp_name(name), {}).get(
-            "include-in-capability-statement", False
-        ),
-        var_name_to_qp_name(name),
+        metadata is None,
+        not (metadata or {}).get("include-in-capability-statement", False),
+        qp_name,
     )
 
 
@@ -138,25 +211,30 @@ def _load_search_parameters_file() -> Dict[str, Dict[str, Dict[str, Union[str, b
     Organize the search parameter file by resource type and return a dict with the data. Initialize
     the search parameters dict with values that aren't present in the JSON file.
     """
-    search_parameters = {"Resource": load_extra_search_parameters()}
+    search_parameters: DefaultDict[str, Dict[str, Dict[str, Union[str, bool]]]] = (
+        defaultdict(dict)
+    )
+    search_parameters["Resource"] = load_extra_search_parameters()
 
     bundle = load_search_parameters()
 
     for entry in bundle["entry"]:
         resource = entry["resource"]
+        name = resource["name"]
+        # There are only a handful of distinct search parameter types, so share one copy of each
+        type_ = sys.intern(resource["type"])
+        description = resource["description"]
+        uri = entry["fullUrl"]
 
         for resource_type in resource["base"]:
-            search_parameters.setdefault(resource_type, {})
-            search_parameters[resource_type][resource["name"]] = {
-                "type": resource["type"],
-                "description": _transform_description(
-                    resource["description"], resource_type
-                ),
-                "uri": entry["fullUrl"],
+            search_parameters[resource_type][name] = {
+                "type": type_,
+                "description": _transform_description(description, resource_type),
+                "uri": uri,
                 "include-in-capability-statement": True,
             }
 
-    return search_parameters
+    return dict(search_parameters)
 
 
 def _transform_description(description: str, resource_type: str) -> str:
@@ -165,8 +243,9 @@ def _transform_description(description: str, resource_type: str) -> str:
     types, and return only the description for the specified resource type.
     """
     if description.startswith("Multiple Resources:"):
+        prefix = f"* [{resource_type}]"
         for description_for_resource_type in description.split("\n"):
-            if description_for_resource_type.startswith(f"* [{resource_type}]"):
+            if description_for_resource_type.startswith(prefix):
                 _, description = description_for_resource_type.split(": ", maxsplit=1)
                 if description.endswith("\r"):
                     return description[:-1]
@@ -1,9 +1,7 @@
 """FHIRStarter test configuration"""
 
-from copy import deepcopy
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Dict, Tuple, Union, cast
+from io import BytesIO
+from typing import Dict, Tuple, Union
 
 import jsonpatch
 
@@ -14,12 +12,26 @@ from ..json_patch import JSONPatch, convert_json_patch
 from ..providers import FHIRProvider
 from ..resources import Bundle, Id
 from ..testclient import TestClient
-from .resources import HumanName, Patient
+from .resources import Patient
 from .utils import generate_fhir_resource_id
 
 # In-memory "database" used to simulate persistence of created FHIR resources
 DATABASE: Dict[str, Patient] = {}
 
+# Parsed from memory by each app, so that creating an app does not touch the filesystem
+_CONFIG_FILE_CONTENTS = b"""
+[app.external-documentation-examples]
+enabled = true
+cache-size = 2048  # number of entries
+cache-ttl-hours = 6
+
+[search-parameters.Patient.nickname]
+type = "string"
+description = "Nickname"
+uri = "https://hostname/nickname"
+include-in-capability-statement = true
+"""
+
 _VALID_TOKEN = "valid"
 _INVALID_TOKEN = "invalid"
 
@@ -50,10 +62,9 @@ def patient_update(_: InteractionContext, id_: Id, resource: Patient) -> Id:
     if id_ not in DATABASE:
         raise FHIRResourceNotFoundError
 
-    patient = deepcopy(resource)
-    DATABASE[id_] = patient
+    DATABASE[id_] = resource
 
-    return Id(patient.id)
+    return Id(resource.id)
 
 
 async def patient_patch_async(
@@ -101,8 +112,7 @@ async def patient_create_async(context: InteractionContext, resource: Patient) -
 
 def patient_create(_: InteractionContext, resource: Patient) -> Id:
     """Patient create FHIR interaction."""
-    patient = deepcopy(resource)
-    patient.id = generate_fhir_resource_id()
+    patient = resource.copy(update={"id": generate_fhir_resource_id()})
     DATABASE[patient.id] = patient
 
     return Id(patient.id)
@@ -129,17 +139,17 @@ def patient_search_type(
     _last_updated: Union[str, None],
 ) -> Bundle:
     """Patient search-type FHIR interaction."""
-    patients = []
-    for patient in DATABASE.values():
-        for name in patient.name:
-            if cast(HumanName, name).family == family:
-                patients.append(patient)
+    entries = [
+        {"resource": patient.dict()}
+        for patient in DATABASE.values()
+        if any(name.family == family for name in patient.name)
+    ]
 
     bundle = Bundle(
         **{
             "type": "searchset",
-            "total": len(patients),
-            "entry": [{"resource": patient.dict()} for patient in patients],
+            "total": len(entries),
+            "entry": entries,
         }
     )
 
@@ -148,26 +158,7 @@ def patient_search_type(
 
 def app(provider: FHIRProvider) -> TestClient:
     """Create a FHIRStarter app, add the provider, reset the database, and return a TestClient."""
-    config_file_contents = """
-[app.external-documentation-examples]
-enabled = true
-cache-size = 2048  # number of entries
-cache-ttl-hours = 6
-
-[search-parameters.Patient.nickname]
-type = "string"
-description = "Nickname"
-uri = "https://hostname/nickname"
-include-in-capability-statement = true
-    """
-
-    with TemporaryDirectory() as path:
-        config_file = Path(path) / "config.toml"
-        with open(config_file, "w") as file_:
-            file_.write(config_file_contents)
-
-        app_ = FHIRStarter(config_file=config_file)
-
+    app_ = FHIRStarter(config_file=BytesIO(_CONFIG_FILE_CONTENTS))
     app_.add_providers(provider)
 
     DATABASE.clear()
@@ -0,0 +1,95 @@
+"""Test FHIR provider interaction registration"""
+
+from typing import Sequence, Union
+
+import pytest
+from fastapi import Depends, params
+
+from ..fhir_specification import FHIR_SEQUENCE
+from ..providers import _DEFAULT_ROUTE_OPTIONS, FHIRProvider
+from .config import patient_read, patient_update
+from .resources import Patient
+
+# A Patient class from a FHIR sequence that is incompatible with the one the tests are running with
+if FHIR_SEQUENCE == "STU3":
+    from fhir.resources.patient import Patient as IncompatiblePatient
+else:
+    from fhir.resources.STU3.patient import Patient as IncompatiblePatient
+
+
+def _dependency_a() -> None:
+    """Provider-level test dependency."""
+
+
+def _dependency_b() -> None:
+    """Interaction-level test dependency."""
+
+
+def test_default_route_options_shared() -> None:
+    """Test that interactions registered with default options share one route options mapping."""
+    provider = FHIRProvider()
+    provider.read(Patient)(patient_read)
+    provider.update(Patient)(patient_update)
+
+    read_interaction, update_interaction = provider.interactions
+
+    assert read_interaction.route_options is _DEFAULT_ROUTE_OPTIONS
+    assert update_interaction.route_options is _DEFAULT_ROUTE_OPTIONS
+
+
+def test_route_options_dependencies() -> None:
+    """Test that provider-level and interaction-level dependencies are merged in order."""
+    dependency_a = Depends(_dependency_a)
+    dependency_b = Depends(_dependency_b)
+
+    provider = FHIRProvider(dependencies=[dependency_a])
+    provider.read(Patient, dependencies=[dependency_b])(patient_read)
+
+    route_options = provider.interactions[0].route_options
+
+    assert route_options is not _DEFAULT_ROUTE_OPTIONS
+    assert route_options == {
+        "dependencies": (dependency_a, dependency_b),
+        "include_in_schema": True,
+    }
+
+
+def test_route_options_include_in_schema() -> None:
+    """Test that excluding an interaction from the schema gives it its own route options."""
+    provider = FHIRProvider()
+    provider.read(Patient, include_in_schema=False)(patient_read)
+
+    route_options = provider.interactions[0].route_options
+
+    assert route_options is not _DEFAULT_ROUTE_OPTIONS
+    assert route_options == {"dependencies": (), "include_in_schema": False}
+
+
+@pytest.mark.parametrize(
+    argnames="dependencies",
+    argvalues=[None, [Depends(_dependency_b)]],
+    ids=["default", "dependencies"],
+)
+def test_route_options_read_only(
+    dependencies: Union[Sequence[params.Depends], None],
+) -> None:
+    """Test that route options cannot be modified after registration."""
+    provider = FHIRProvider()
+    provider.read(Patient, dependencies=dependencies)(patient_read)
+
+    with pytest.raises(TypeError):
+        provider.interactions[0].route_options["include_in_schema"] = False  # type: ignore[index]
+
+
+def test_incompatible_resource_type() -> None:
+    """
+    Test that registering a resource type from an incompatible FHIR sequence fails every time, since
+    failed checks are not cached.
+    """
+    provider = FHIRProvider()
+
+    for _ in range(2):
+        with pytest.raises(AssertionError):
+            provider.read(IncompatiblePatient)(patient_read)
+
+    assert not provider.interactions
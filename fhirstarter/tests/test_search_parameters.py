@@ -0,0 +1,139 @@
+"""Test search parameter utilities"""
+
+import copy
+import gc
+import pickle
+import weakref
+from typing import Any, Dict, List, Optional, Union
+
+import pytest
+
+from ..interactions import InteractionContext
+from ..search_parameters import (
+    _SUPPORTED_SEARCH_PARAMETERS,
+    SearchParameters,
+    SupportedSearchParameter,
+    supported_search_parameters,
+    var_name_to_qp_name,
+)
+
+
+@pytest.mark.parametrize(
+    argnames="var_name,qp_name",
+    argvalues=[
+        ("family", "family"),
+        ("general_practitioner", "general-practitioner"),
+        ("class_", "class"),
+        ("_id", "_id"),
+        ("_last_updated", "_lastUpdated"),
+    ],
+)
+def test_var_name_to_qp_name(var_name: str, qp_name: str) -> None:
+    assert var_name_to_qp_name(var_name) == qp_name
+
+
+@pytest.mark.parametrize(
+    argnames="annotation,multiple",
+    argvalues=[
+        (str, False),
+        (Union[str, None], False),
+        (List[str], True),
+        (Union[List[str], None], True),
+        (Union[List[str], int], True),
+        (Optional["List[str]"], True),
+        (Optional["List[int]"], False),
+        (List[int], False),
+        ("Union[List[str], None]", True),
+    ],
+    ids=[
+        "str",
+        "optional str",
+        "list",
+        "optional list",
+        "list or int",
+        "optional forward reference",
+        "optional forward reference to list of int",
+        "list of int",
+        "string annotation",
+    ],
+)
+def test_supported_search_parameters_multiple(annotation: Any, multiple: bool) -> None:
+    def search_type(context: InteractionContext, given: annotation) -> None:
+        pass
+
+    search_parameters = supported_search_parameters(search_type)
+
+    assert len(search_parameters) == 1
+    assert search_parameters[0].name == "given"
+    assert search_parameters[0].multiple is multiple
+
+
+def test_supported_search_parameters_cache() -> None:
+    """Test that supported search parameters are cached without keeping the handler alive."""
+
+    def search_type(context: InteractionContext, family: str) -> None:
+        pass
+
+    search_parameters = supported_search_parameters(search_type)
+
+    assert supported_search_parameters(search_type) is search_parameters
+    assert search_type in _SUPPORTED_SEARCH_PARAMETERS
+
+    handler_ref = weakref.ref(search_type)
+    cache_size = len(_SUPPORTED_SEARCH_PARAMETERS)
+    del search_type
+    gc.collect()
+
+    assert handler_ref() is None
+    assert len(_SUPPORTED_SEARCH_PARAMETERS) == cache_size - 1
+
+
+def test_supported_search_parameters_not_weakly_referenceable() -> None:
+    """Test that callables that do not support weak references are inspected without caching."""
+
+    class SearchType:
+        __slots__ = ()
+
+        def __call__(self, family: List[str]) -> None:
+            pass
+
+    search_type = SearchType()
+
+    with pytest.raises(TypeError):
+        weakref.ref(search_type)
+
+    for _ in range(2):
+        search_parameters = supported_search_parameters(search_type)
+
+        assert search_parameters == (
+            SupportedSearchParameter(name="family", multiple=True),  # type: ignore[call-arg]
+        )
+        assert search_type not in _SUPPORTED_SEARCH_PARAMETERS
+
+
+def test_supported_search_parameter_copy() -> None:
+    """Test that supported search parameters can be copied and pickled."""
+    search_parameter = SupportedSearchParameter(name="family", multiple=False)  # type: ignore[call-arg]
+
+    assert copy.deepcopy(search_parameter) == search_parameter
+    assert pickle.loads(pickle.dumps(search_parameter)) == search_parameter
+
+
+def test_get_metadata() -> None:
+    """Test that search parameter metadata is merged once per resource type and is read-only."""
+    nickname: Dict[str, Any] = {
+        "type": "string",
+        "description": "Nickname",
+        "uri": "https://hostname/nickname",
+        "include-in-capability-statement": True,
+    }
+    search_parameters = SearchParameters({"Patient": {"nickname": nickname}})
+
+    metadata = search_parameters.get_metadata("Patient")
+
+    assert metadata["nickname"] == nickname
+    assert metadata["family"]["type"] == "string"
+    assert metadata["_id"]["type"] == "token"
+    assert search_parameters.get_metadata("Patient") is metadata
+    with pytest.raises(TypeError):
+        metadata["nickname"] = {}  # type: ignore[index]
@@ -1,8 +1,8 @@
 """Test utilities"""
 
+import secrets
 from typing import Any, Dict, Mapping, Union
 from urllib.parse import urlparse
-from uuid import uuid4
 
 import orjson
 from funcy import omit
@@ -32,13 +32,13 @@ def resource(id_: Union[str, None] = None) -> Dict[str, Any]:
 
 
 def generate_fhir_resource_id() -> Id:
-    """Generate a UUID-based FHIR Resource ID."""
-    return Id(str(uuid4()))
+    """Generate a random hexadecimal FHIR Resource ID."""
+    return Id(secrets.token_hex(16))
 
 
 def id_from_location_header(response: Response) -> str:
     """Extract the resource identifier from a FHIR create interaction response."""
-    return response.headers["Location"].split("/")[2]
+    return response.headers["Location"].rpartition("/")[2]
 
 
 def json_dumps_pretty(value: Any) -> str:
@@ -93,4 +93,4 @@ def assert_expected_response(
         if isinstance(content, str):
             assert response.content.decode() == content
         else:
-            assert response.json() == content
+            assert orjson.loads(response.content) == content